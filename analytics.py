@@ -0,0 +1,220 @@
+"""
+Recruiter reporting and exports built on chunked SQL reads.
+
+pandas (and pyarrow for Parquet) are imported inside the functions that
+need them so the Streamlit app and API don't pay for them at startup.
+"""
+import hashlib
+import hmac
+import io
+import os
+import time
+
+from database import get_connection
+
+CHUNK_SIZE = 50_000
+
+# Signs export links handed out by the Streamlit app and checked by api.py
+EXPORT_SECRET = os.environ.get("JOB_EXPORT_SECRET") or os.environ.get("JOB_API_TOKEN")
+EXPORT_LINK_TTL = 15 * 60
+
+STATUS_ORDER = ["Applied", "Interview Scheduled", "Rejected", "Offer Received", "Accepted"]
+
+# Live and archived rows both count towards a company's history
+APPLICATIONS_QUERY = """
+    SELECT ja.job_posting_id, ja.status, ja.applied_date, ja.status_changed_at
+    FROM job_applications ja JOIN job_postings jp ON ja.job_posting_id = jp.id
+    WHERE jp.company_id = ?
+    UNION ALL
+    SELECT ja.job_posting_id, ja.status, ja.applied_date, ja.status_changed_at
+    FROM job_applications_archive ja JOIN job_postings_archive jp ON ja.job_posting_id = jp.id
+    WHERE jp.company_id = ?
+"""
+
+POSTINGS_QUERY = """
+    SELECT id, title, job_type FROM job_postings WHERE company_id = ?
+    UNION ALL
+    SELECT id, title, job_type FROM job_postings_archive WHERE company_id = ?
+"""
+
+# kind -> (query taking company_id twice, columns, integer columns)
+EXPORTS = {
+    "applicants": ("""
+        SELECT ja.id AS application_id, ja.job_posting_id, jp.title, u.name, u.email,
+               ja.status, ja.applied_date, ja.status_changed_at
+        FROM job_applications ja
+        JOIN job_postings jp ON ja.job_posting_id = jp.id
+        LEFT JOIN users u ON ja.user_id = u.id
+        WHERE jp.company_id = ?
+        UNION ALL
+        SELECT ja.id, ja.job_posting_id, jp.title, u.name, u.email,
+               ja.status, ja.applied_date, ja.status_changed_at
+        FROM job_applications_archive ja
+        JOIN job_postings_archive jp ON ja.job_posting_id = jp.id
+        LEFT JOIN users u ON ja.user_id = u.id
+        WHERE jp.company_id = ?
+    """, ["application_id", "job_posting_id", "title", "name", "email",
+          "status", "applied_date", "status_changed_at"],
+        {"application_id", "job_posting_id"}),
+    "postings": ("""
+        SELECT id, title, location, salary_range, salary_currency, salary_min, salary_max,
+               job_type, status, created_at, expires_at, NULL AS archived_at
+        FROM job_postings WHERE company_id = ?
+        UNION ALL
+        SELECT id, title, location, salary_range, salary_currency, salary_min, salary_max,
+               job_type, status, created_at, expires_at, archived_at
+        FROM job_postings_archive WHERE company_id = ?
+    """, ["id", "title", "location", "salary_range", "salary_currency", "salary_min", "salary_max",
+          "job_type", "status", "created_at", "expires_at", "archived_at"],
+        {"id", "salary_min", "salary_max"}),
+}
+
+EXPORT_FORMATS = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+def read_chunks(query, params):
+    """Yield DataFrames of at most CHUNK_SIZE rows so whole tables never sit in memory."""
+    import pandas as pd
+
+    conn = get_connection()
+    try:
+        yield from pd.read_sql_query(query, conn, params=params, chunksize=CHUNK_SIZE)
+    finally:
+        conn.close()
+
+# ------------------ REPORT ------------------
+def company_report(company_id):
+    """
+    Aggregate a company's applications and postings chunk by chunk.
+    Each chunk is reduced with vectorised groupby/value_counts and the
+    partial results are summed, so memory stays bounded by CHUNK_SIZE.
+    """
+    import pandas as pd
+
+    per_posting = pd.Series(dtype="int64")
+    funnel = pd.Series(dtype="int64")
+    response_hours_total = 0.0
+    responses = 0
+    for chunk in read_chunks(APPLICATIONS_QUERY, (company_id, company_id)):
+        per_posting = per_posting.add(chunk.groupby("job_posting_id").size(), fill_value=0)
+        funnel = funnel.add(chunk["status"].value_counts(), fill_value=0)
+        applied = pd.to_datetime(chunk["applied_date"], errors="coerce")
+        changed = pd.to_datetime(chunk["status_changed_at"], errors="coerce")
+        hours = ((changed - applied).dt.total_seconds() / 3600).dropna()
+        response_hours_total += hours.sum()
+        responses += len(hours)
+
+    titles = pd.Series(dtype="object")
+    by_job_type = pd.Series(dtype="int64")
+    for chunk in read_chunks(POSTINGS_QUERY, (company_id, company_id)):
+        titles = pd.concat([titles, chunk.set_index("id")["title"]])
+        by_job_type = by_job_type.add(chunk["job_type"].fillna("Unspecified").value_counts(), fill_value=0)
+
+    applications_per_posting = (
+        per_posting.astype("int64").rename("applications").rename_axis("job_posting_id").reset_index()
+    )
+    applications_per_posting["title"] = applications_per_posting["job_posting_id"].map(titles)
+    applications_per_posting = applications_per_posting.sort_values("applications", ascending=False)
+
+    funnel_order = STATUS_ORDER + [status for status in funnel.index if status not in STATUS_ORDER]
+    status_funnel = (
+        funnel.reindex(funnel_order, fill_value=0).astype("int64")
+        .rename("applications").rename_axis("status").reset_index()
+    )
+
+    postings_by_job_type = (
+        by_job_type.astype("int64").sort_values(ascending=False)
+        .rename("postings").rename_axis("job_type").reset_index()
+    )
+
+    return {
+        "applications_per_posting": applications_per_posting[["job_posting_id", "title", "applications"]],
+        "status_funnel": status_funnel,
+        "postings_by_job_type": postings_by_job_type,
+        "total_applications": int(per_posting.sum()),
+        "total_postings": int(by_job_type.sum()),
+        "avg_hours_to_first_status_change": response_hours_total / responses if responses else None,
+        "status_changes": responses,
+    }
+
+# ------------------ EXPORTS ------------------
+class _StreamSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain()."""
+
+    def __init__(self):
+        self.parts = []
+        self.offset = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.offset += len(data)
+        return len(data)
+
+    def tell(self):
+        # Parquet records absolute offsets in its footer, so report bytes written overall
+        return self.offset
+
+    def drain(self):
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _typed(chunk, columns, int_columns):
+    # Fixed dtypes keep every chunk's schema identical, even for all-NULL chunks
+    return chunk.astype({column: "Int64" if column in int_columns else "string" for column in columns})
+
+def iter_export(kind, company_id, fmt):
+    """Yield the export as bytes, one chunk of rows at a time."""
+    query, columns, int_columns = EXPORTS[kind]
+    chunks = read_chunks(query, (company_id, company_id))
+
+    if fmt == "csv":
+        header_written = False
+        for chunk in chunks:
+            yield _typed(chunk, columns, int_columns).to_csv(index=False, header=not header_written).encode()
+            header_written = True
+        if not header_written:
+            yield (",".join(columns) + "\n").encode()
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.int64() if column in int_columns else pa.string()) for column in columns])
+    sink = _StreamSink()
+    writer = pq.ParquetWriter(sink, schema)
+    for chunk in chunks:
+        writer.write_table(pa.Table.from_pandas(_typed(chunk, columns, int_columns), schema=schema,
+                                                preserve_index=False))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+def _export_signature(company_id, kind, fmt, expires):
+    message = f"{company_id}:{kind}:{fmt}:{expires}".encode()
+    return hmac.new(EXPORT_SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+def sign_export(company_id, kind, fmt):
+    """Query parameters for a time-limited export link."""
+    expires = int(time.time()) + EXPORT_LINK_TTL
+    return {"expires": expires, "signature": _export_signature(company_id, kind, fmt, expires)}
+
+def verify_export(company_id, kind, fmt, expires, signature):
+    if not EXPORT_SECRET or not expires or not signature:
+        return False
+    try:
+        if int(expires) < time.time():
+            return False
+    except ValueError:
+        return False
+    # Compare bytes: compare_digest rejects non-ASCII str with TypeError
+    return hmac.compare_digest(signature.encode(), _export_signature(company_id, kind, fmt, expires).encode())
@@ -0,0 +1,211 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from aiohttp import web
+
+from analytics import EXPORTS, EXPORT_FORMATS, iter_export, parquet_available, verify_export
+from database import (
+    init_db,
+    get_data_version,
+    get_active_job_postings_page,
+    get_job_postings_by_company_page,
+    get_user_applications_page,
+)
+
+# ================== CONFIG ==================
+# Applications are personal data: that endpoint stays disabled until a token is set
+API_TOKEN = os.environ.get("JOB_API_TOKEN")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+GZIP_MIN_BYTES = 1024
+
+# ================== CURSORS ==================
+def encode_cursor(sort_value, row_id):
+    raw = json.dumps([sort_value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor):
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        # Sort keys are timestamps; anything else would reach sqlite as a bad parameter
+        if not isinstance(sort_value, str):
+            raise TypeError(sort_value)
+        return sort_value, int(row_id)
+    except (ValueError, TypeError):
+        raise web.HTTPBadRequest(text="Invalid cursor")
+
+def parse_limit(request):
+    try:
+        limit = int(request.query.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise web.HTTPBadRequest(text="limit must be an integer")
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+# ================== CONDITIONAL GET ==================
+def parse_db_timestamp(value):
+    # SQLite CURRENT_TIMESTAMP is UTC "YYYY-MM-DD HH:MM:SS"
+    if not value:
+        return None
+    return datetime.strptime(value[:19], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+
+def is_not_modified(request, etag, last_modified):
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110 13.2.2)
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since and last_modified:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+async def page_response(request, scope, fetch, sort_key, private=False):
+    """
+    Serve one keyset page of `fetch(after, limit)` as JSON.
+
+    The validators come from the scope's data version, so a 304 costs a
+    single primary-key lookup and never runs the page query.
+    """
+    limit = parse_limit(request)
+    cursor = request.query.get("cursor")
+    after = decode_cursor(cursor) if cursor else None
+
+    version, updated_at = await asyncio.to_thread(get_data_version, scope)
+    digest = hashlib.sha256(f"{scope}:{version}:{request.path_qs}".encode()).hexdigest()
+    etag = f'"{digest[:32]}"'
+    last_modified = parse_db_timestamp(updated_at)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": ("private" if private else "public") + ", max-age=0, must-revalidate",
+        "Vary": "Accept-Encoding" + (", Authorization" if private else ""),
+    }
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if is_not_modified(request, etag, last_modified):
+        return web.Response(status=304, headers=headers)
+
+    # Fetch one extra row to know whether another page exists
+    rows = await asyncio.to_thread(fetch, after, limit + 1)
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(last[sort_key], last["id"])
+
+    body = json.dumps({"items": items, "next_cursor": next_cursor}).encode()
+    response = web.Response(body=body, content_type="application/json", headers=headers)
+    if len(body) >= GZIP_MIN_BYTES and "gzip" in request.headers.get("Accept-Encoding", ""):
+        response.enable_compression(web.ContentCoding.gzip)
+    return response
+
+def require_token(request):
+    if not API_TOKEN:
+        raise web.HTTPForbidden(text="Set JOB_API_TOKEN to enable this endpoint")
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(supplied.encode(), API_TOKEN.encode()):
+        raise web.HTTPUnauthorized(text="Invalid or missing bearer token")
+
+def path_int(request, name):
+    try:
+        return int(request.match_info[name])
+    except ValueError:
+        raise web.HTTPNotFound()
+
+# ================== HANDLERS ==================
+async def active_postings(request):
+    return await page_response(
+        request, "job_postings", get_active_job_postings_page, "created_at",
+    )
+
+async def company_postings(request):
+    company_id = path_int(request, "company_id")
+    return await page_response(
+        request, "job_postings",
+        lambda after, limit: get_job_postings_by_company_page(company_id, after, limit),
+        "created_at",
+    )
+
+async def user_applications(request):
+    require_token(request)
+    user_id = path_int(request, "user_id")
+    return await page_response(
+        request, "job_applications",
+        lambda after, limit: get_user_applications_page(user_id, after, limit),
+        "applied_date",
+        private=True,
+    )
+
+async def company_export(request):
+    """Stream a signed applicants/postings export chunk by chunk."""
+    company_id = path_int(request, "company_id")
+    kind, fmt = request.match_info["kind"], request.match_info["fmt"]
+    if kind not in EXPORTS or fmt not in EXPORT_FORMATS:
+        raise web.HTTPNotFound()
+    if not verify_export(company_id, kind, fmt, request.query.get("expires"), request.query.get("signature")):
+        raise web.HTTPForbidden(text="Invalid or expired export link")
+    if fmt == "parquet" and not parquet_available():
+        raise web.HTTPNotImplemented(text="Parquet export needs pyarrow installed")
+
+    response = web.StreamResponse(headers={
+        "Content-Type": EXPORT_FORMATS[fmt],
+        "Content-Disposition": f'attachment; filename="{kind}-{company_id}.{fmt}"',
+        "Cache-Control": "no-store",
+    })
+    response.enable_chunked_encoding()
+    if fmt == "csv" and "gzip" in request.headers.get("Accept-Encoding", ""):
+        response.enable_compression(web.ContentCoding.gzip)
+    await response.prepare(request)
+
+    # Each chunk is read and encoded off the event loop, then written out
+    chunks = iter_export(kind, company_id, fmt)
+    try:
+        while True:
+            data = await asyncio.to_thread(next, chunks, None)
+            if data is None:
+                break
+            if data:
+                await response.write(data)
+    finally:
+        # A cancelled request may leave next() running in its worker thread
+        if not chunks.gi_running:
+            chunks.close()
+    await response.write_eof()
+    return response
+
+async def health(request):
+    return web.json_response({"status": "ok"})
+
+def create_app():
+    app = web.Application()
+    app.add_routes([
+        web.get("/health", health),
+        web.get("/api/postings", active_postings),
+        web.get("/api/companies/{company_id}/postings", company_postings),
+        web.get("/api/users/{user_id}/applications", user_applications),
+        web.get("/api/companies/{company_id}/exports/{kind:[a-z]+}.{fmt:[a-z]+}", company_export),
+    ])
+    return app
+
+# ================== MAIN ==================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read-only JSON API for Job AI Portal")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("API_PORT", 8000)))
+    parser.add_argument("--reuse-port", action="store_true",
+                        help="Let several API processes share the port (Linux)")
+    args = parser.parse_args()
+
+    init_db()
+    web.run_app(create_app(), host=args.host, port=args.port, reuse_port=args.reuse_port or None)
@@ -0,0 +1,84 @@
+import re
+import threading
+
+def tokenize(text):
+    # Split on anything that isn't a letter or digit: "Remote (Pune, India)" -> remote pune india
+    return re.findall(r"\w+", text.lower())
+
+class PrefixTrie:
+    """
+    Lowercase prefix trie mapping word-start prefixes of labels to ids.
+
+    Each label is indexed from every word start, so "maha" finds
+    "Pune, Maharashtra, India" and "cons" finds "Tata Consultancy".
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, label, value):
+        words = tokenize(label)
+        for start in range(len(words)):
+            node = self.root
+            for char in " ".join(words[start:]):
+                node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(value)
+
+    def search(self, prefix, limit=20):
+        """Up to `limit` ids whose label has a word starting with `prefix`."""
+        words = tokenize(prefix)
+        if not words:
+            return []
+        node = self.root
+        for char in " ".join(words):
+            node = node.get(char)
+            if node is None:
+                return []
+        found = []
+        stack = [node]
+        while stack and len(found) < limit:
+            node = stack.pop()
+            for value in node.get(None, ()):
+                if value not in found:
+                    found.append(value)
+            stack.extend(child for key, child in node.items() if key is not None)
+        return found[:limit]
+
+class AutocompleteIndex:
+    """
+    PrefixTrie kept in sync with a table without full rebuilds.
+
+    `load_since(last_id)` returns (id, label) rows with id > last_id and is
+    called on every refresh, so only new rows are inserted. When the
+    optional `get_version()` changes (rows were edited, not just added) the
+    trie is rebuilt from scratch.
+    """
+
+    def __init__(self, load_since, get_version=None):
+        self.load_since = load_since
+        self.get_version = get_version
+        self.lock = threading.Lock()
+        self.trie = PrefixTrie()
+        self.labels = {}
+        self.last_id = 0
+        self.version = None
+
+    def refresh(self):
+        with self.lock:
+            if self.get_version:
+                version = self.get_version()
+                if version != self.version:
+                    self.trie = PrefixTrie()
+                    self.labels = {}
+                    self.last_id = 0
+                    self.version = version
+            for row_id, label in self.load_since(self.last_id):
+                self.trie.insert(label, row_id)
+                self.labels[row_id] = label
+                self.last_id = max(self.last_id, row_id)
+
+    def suggest(self, prefix, limit=20):
+        """[(id, label)] for labels matching `prefix`, sorted by label."""
+        self.refresh()
+        ids = self.trie.search(prefix, limit)
+        return sorted(((row_id, self.labels[row_id]) for row_id in ids), key=lambda item: item[1])
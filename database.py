@@ -0,0 +1,731 @@
+import sqlite3
+import hashlib
+
+from salary import parse_salary
+from locations import normalise_location, display_name
+
+# ------------------ DATABASE CONFIG ------------------
+DB_NAME = "job_ai.db"
+
+# Postings expire this many days after creation unless the recruiter picks otherwise
+DEFAULT_POSTING_TTL_DAYS = 30
+
+# Columns added after the original schema; init_db() adds any that are missing
+JOB_POSTING_EXTRA_COLUMNS = {
+    "salary_currency": "TEXT",
+    "salary_min": "INTEGER",
+    "salary_max": "INTEGER",
+    "salary_period": "TEXT",
+    "location_id": "INTEGER REFERENCES locations (id)",
+    "expires_at": "TEXT",
+}
+
+JOB_APPLICATION_EXTRA_COLUMNS = {
+    "status_changed_at": "TEXT",  # first status change, for time-to-response reporting
+}
+
+# Explicit column list keeps positional row indexes stable as columns are added
+POSTING_COLUMNS = (
+    "jp.id, jp.company_id, jp.title, jp.description, jp.requirements, "
+    "jp.location, jp.salary_range, jp.job_type, jp.status, jp.created_at"
+)
+
+def get_connection():
+    return sqlite3.connect(DB_NAME, check_same_thread=False)
+
+def add_missing_columns(c, table, columns):
+    existing = {row[1] for row in c.execute(f"PRAGMA table_info({table})")}
+    for name, column_type in columns.items():
+        if name not in existing:
+            c.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+
+def sync_archive_table(c, table, archive):
+    """Create `archive` as a copy of `table`'s columns plus archived_at, adding any columns it lacks."""
+    c.execute(f"CREATE TABLE IF NOT EXISTS {archive} AS SELECT * FROM {table} WHERE 0")
+    columns = {row[1]: row[2] for row in c.execute(f"PRAGMA table_info({table})")}
+    columns["archived_at"] = "TEXT"
+    add_missing_columns(c, archive, columns)
+
+def init_db():
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL DEFAULT 'job_seeker',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS companies (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            recruiter_id INTEGER NOT NULL,
+            company_name TEXT NOT NULL,
+            industry TEXT,
+            website TEXT,
+            description TEXT,
+            location TEXT,
+            logo_path TEXT,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (recruiter_id) REFERENCES users (id)
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS job_postings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            requirements TEXT,
+            location TEXT,
+            salary_range TEXT,
+            job_type TEXT,
+            status TEXT DEFAULT 'active',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (company_id) REFERENCES companies (id)
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS job_applications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            job_posting_id INTEGER NOT NULL,
+            status TEXT DEFAULT 'Applied',
+            applied_date TEXT DEFAULT CURRENT_TIMESTAMP,
+            resume_path TEXT,
+            cover_letter TEXT,
+            notes TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (id),
+            FOREIGN KEY (job_posting_id) REFERENCES job_postings (id)
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS locations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            city TEXT,
+            state TEXT,
+            country TEXT,
+            is_remote INTEGER NOT NULL DEFAULT 0,
+            display_name TEXT UNIQUE NOT NULL
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS data_versions (
+            scope TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    # Append-only analytics log written in batches by events.EventBuffer
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT NOT NULL,
+            job_posting_id INTEGER,
+            user_id INTEGER,
+            data TEXT,
+            created_at TEXT NOT NULL
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS posting_daily_stats (
+            job_posting_id INTEGER NOT NULL,
+            day TEXT NOT NULL,
+            views INTEGER NOT NULL DEFAULT 0,
+            applies INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (job_posting_id, day)
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS rollup_state (
+            name TEXT PRIMARY KEY,
+            last_event_id INTEGER NOT NULL
+        )
+    """)
+    add_missing_columns(c, "job_postings", JOB_POSTING_EXTRA_COLUMNS)
+    add_missing_columns(c, "job_applications", JOB_APPLICATION_EXTRA_COLUMNS)
+    # Closed postings and their applications move here so live tables stay small
+    sync_archive_table(c, "job_postings", "job_postings_archive")
+    sync_archive_table(c, "job_applications", "job_applications_archive")
+    # Keyset pagination indexes: (filter, sort key, id tiebreaker)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_status_created ON job_postings (status, created_at, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_company_created ON job_postings (company_id, created_at, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_applications_user_applied ON job_applications (user_id, applied_date, id)")
+    # Salary range filter/sort: equality prefix, then a range scan on salary_max
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_salary ON job_postings (status, salary_currency, salary_max)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_location ON job_postings (location_id, status)")
+    # Lifecycle sweeper and archive lookups
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_status_expires ON job_postings (status, expires_at)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_applications_posting ON job_applications (job_posting_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_postings_archive_company ON job_postings_archive (company_id, created_at)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_applications_archive_user ON job_applications_archive (user_id, applied_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_job_applications_archive_posting ON job_applications_archive (job_posting_id)")
+    # WAL lets API readers run alongside Streamlit writers
+    c.execute("PRAGMA journal_mode=WAL")
+    conn.commit()
+    conn.close()
+
+# ------------------ DATA VERSIONS ------------------
+def bump_data_version(c, scope):
+    """Record a write to `scope` inside the caller's transaction."""
+    c.execute("""
+        INSERT INTO data_versions (scope, version, updated_at) VALUES (?, 1, CURRENT_TIMESTAMP)
+        ON CONFLICT(scope) DO UPDATE SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+    """, (scope,))
+
+def get_data_version(scope):
+    """Return (version, updated_at) for `scope`; (0, None) if never written."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT version, updated_at FROM data_versions WHERE scope = ?", (scope,))
+    row = c.fetchone()
+    conn.close()
+    return row if row else (0, None)
+
+# ------------------ SECURITY FUNCTIONS ------------------
+def hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+def verify_password(password, hashed):
+    return hash_password(password) == hashed
+
+# ------------------ AUTH FUNCTIONS ------------------
+def create_user(name, email, password, role='job_seeker'):
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        c.execute(
+            "INSERT INTO users (name, email, password, role) VALUES (?, ?, ?, ?)",
+            (name, email, hash_password(password), role)
+        )
+        conn.commit()
+        return True
+    except sqlite3.IntegrityError:
+        return False
+    finally:
+        conn.close()
+
+def login_user(email, password):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT * FROM users WHERE email = ?", (email,))
+    user = c.fetchone()
+    conn.close()
+    if user and verify_password(password, user[3]):
+        return user
+    return None
+
+# ------------------ JOB APPLICATION FUNCTIONS ------------------
+def add_job_application(user_id, company, position, notes=""):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(
+        "INSERT INTO job_applications (user_id, company, position, notes) VALUES (?, ?, ?, ?)",
+        (user_id, company, position, notes)
+    )
+    bump_data_version(c, "job_applications")
+    conn.commit()
+    conn.close()
+
+def update_application_status(application_id, status):
+    """Update a live application. Returns False if it is missing or archived."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""
+        UPDATE job_applications
+        SET status = ?, status_changed_at = COALESCE(status_changed_at, CURRENT_TIMESTAMP)
+        WHERE id = ?
+    """, (status, application_id))
+    updated = c.rowcount > 0
+    if updated:
+        bump_data_version(c, "job_applications")
+    conn.commit()
+    conn.close()
+    return updated
+
+def _user_applications_query(c):
+    """
+    UNION ALL of a user's live and archived applications (user_id bound
+    twice), in the live table's column order plus a trailing `archived`
+    flag (0 or 1).
+    """
+    columns = ", ".join(row[1] for row in c.execute("PRAGMA table_info(job_applications)"))
+    return f"""
+        SELECT {columns}, 0 AS archived FROM job_applications WHERE user_id = ?
+        UNION ALL
+        SELECT {columns}, 1 AS archived FROM job_applications_archive WHERE user_id = ?
+    """
+
+def get_user_applications(user_id):
+    """Live and archived applications, newest first. Archived rows are read-only."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(_user_applications_query(c) + " ORDER BY applied_date DESC", (user_id, user_id))
+    apps = c.fetchall()
+    conn.close()
+    return apps
+
+# ------------------ COMPANY FUNCTIONS ------------------
+def get_company_by_recruiter(recruiter_id):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT * FROM companies WHERE recruiter_id = ?", (recruiter_id,))
+    company = c.fetchone()
+    conn.close()
+    return company
+
+def save_company_profile(recruiter_id, company_name, industry, website, description, location):
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        # Check if company profile already exists
+        existing = get_company_by_recruiter(recruiter_id)
+        if existing:
+            # Update existing
+            c.execute("""
+                UPDATE companies 
+                SET company_name=?, industry=?, website=?, description=?, location=? 
+                WHERE recruiter_id=?
+            """, (company_name, industry, website, description, location, recruiter_id))
+            # A rename invalidates the company autocomplete; new companies are picked up incrementally
+            if existing[2] != company_name:
+                bump_data_version(c, "company_names")
+        else:
+            # Create new
+            c.execute("""
+                INSERT INTO companies (recruiter_id, company_name, industry, website, description, location) 
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (recruiter_id, company_name, industry, website, description, location))
+        # Postings without their own location inherit the company's
+        company_id = c.execute("SELECT id FROM companies WHERE recruiter_id = ?", (recruiter_id,)).fetchone()[0]
+        c.execute("""
+            UPDATE job_postings SET location_id = ?
+            WHERE company_id = ? AND (location IS NULL OR location = '')
+        """, (get_or_create_location(c, location), company_id))
+        # Postings embed company_name/location
+        bump_data_version(c, "job_postings")
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error saving company profile: {e}")
+        return False
+    finally:
+        conn.close()
+
+# ------------------ LOCATION FUNCTIONS ------------------
+def get_or_create_location(c, text):
+    """locations.id for free-text `text` inside the caller's transaction; None if blank."""
+    location = normalise_location(text)
+    if location is None:
+        return None
+    name = display_name(location)
+    c.execute("""
+        INSERT OR IGNORE INTO locations (city, state, country, is_remote, display_name)
+        VALUES (?, ?, ?, ?, ?)
+    """, (location.city, location.state, location.country, int(location.is_remote), name))
+    return c.execute("SELECT id FROM locations WHERE display_name = ?", (name,)).fetchone()[0]
+
+def get_locations_since(last_id):
+    """(id, display_name) rows added after `last_id`, for incremental autocomplete."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT id, display_name FROM locations WHERE id > ? ORDER BY id", (last_id,))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def get_companies_since(last_id):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT id, company_name FROM companies WHERE id > ? ORDER BY id", (last_id,))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def backfill_location_ids(batch_size=500, force=False):
+    """
+    Map existing postings to locations in id-ordered batches, falling back
+    to the company location. Returns the number of rows updated.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    last_id = 0
+    updated = 0
+    while True:
+        c.execute(f"""
+            SELECT jp.id, jp.location, c.location FROM job_postings jp
+            JOIN companies c ON jp.company_id = c.id
+            WHERE jp.id > ? {"" if force else "AND jp.location_id IS NULL"}
+            ORDER BY jp.id LIMIT ?
+        """, (last_id, batch_size))
+        rows = c.fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        batch = []
+        for posting_id, location, company_location in rows:
+            location_id = get_or_create_location(c, location or company_location)
+            if location_id is not None:
+                batch.append((location_id, posting_id))
+        c.executemany("UPDATE job_postings SET location_id = ? WHERE id = ?", batch)
+        if batch:
+            bump_data_version(c, "job_postings")
+        conn.commit()
+        updated += len(batch)
+    conn.close()
+    return updated
+
+# ------------------ JOB POSTING FUNCTIONS ------------------
+def salary_columns(salary_range):
+    """(currency, min, max, period) for the salary_* columns; all None if unparseable."""
+    parsed = parse_salary(salary_range)
+    return tuple(parsed) if parsed else (None, None, None, None)
+
+def create_job_posting(company_id, title, description, requirements, location, salary_range, job_type,
+                       expires_in_days=DEFAULT_POSTING_TTL_DAYS):
+    conn = get_connection()
+    c = conn.cursor()
+    try:
+        if not location:
+            company_location = c.execute("SELECT location FROM companies WHERE id = ?", (company_id,)).fetchone()
+            location_id = get_or_create_location(c, company_location[0] if company_location else None)
+        else:
+            location_id = get_or_create_location(c, location)
+        c.execute("""
+            INSERT INTO job_postings (company_id, title, description, requirements, location, salary_range, job_type,
+                                      salary_currency, salary_min, salary_max, salary_period, location_id, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now', ?))
+        """, (company_id, title, description, requirements, location, salary_range, job_type)
+            + salary_columns(salary_range) + (location_id, f"+{int(expires_in_days)} days"))
+        bump_data_version(c, "job_postings")
+        conn.commit()
+        return True
+    except Exception as e:
+        print(f"Error creating job posting: {e}")
+        return False
+    finally:
+        conn.close()
+
+def get_job_postings_by_company(company_id):
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(f"""
+        SELECT {POSTING_COLUMNS}, c.company_name, jp.expires_at FROM job_postings jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.company_id = ?
+        ORDER BY jp.created_at DESC
+    """, (company_id,))
+    postings = c.fetchall()
+    conn.close()
+    return postings
+
+def get_archived_job_postings_by_company(company_id):
+    """Same row layout as get_job_postings_by_company(), with archived_at last."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(f"""
+        SELECT {POSTING_COLUMNS}, c.company_name, jp.archived_at FROM job_postings_archive jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.company_id = ?
+        ORDER BY jp.created_at DESC
+    """, (company_id,))
+    postings = c.fetchall()
+    conn.close()
+    return postings
+
+def get_all_active_job_postings():
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(f"""
+        SELECT {POSTING_COLUMNS}, c.company_name, c.location as company_location FROM job_postings jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.status = 'active'
+        ORDER BY jp.created_at DESC
+    """)
+    postings = c.fetchall()
+    conn.close()
+    return postings
+
+def count_active_job_postings():
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("SELECT COUNT(*) FROM job_postings WHERE status = 'active'")
+    count = c.fetchone()[0]
+    conn.close()
+    return count
+
+SALARY_SORTS = {
+    "newest": "jp.created_at DESC",
+    "salary_desc": "jp.salary_max DESC",
+    "salary_asc": "jp.salary_min ASC",
+}
+
+def search_active_job_postings(job_type=None, salary_currency=None, salary_min=None, salary_max=None, sort="newest",
+                               location_ids=None, company_ids=None):
+    """
+    Active postings filtered in SQL. A salary filter keeps postings whose
+    annualised range overlaps [salary_min, salary_max] in salary_currency.
+    `location_ids`/`company_ids` restrict to those ids when not None.
+    """
+    query = f"""
+        SELECT {POSTING_COLUMNS}, c.company_name, c.location as company_location FROM job_postings jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.status = 'active'
+    """
+    params = []
+    if job_type:
+        query += " AND jp.job_type = ?"
+        params.append(job_type)
+    for column, ids in (("jp.location_id", location_ids), ("jp.company_id", company_ids)):
+        if ids is not None:
+            query += f" AND {column} IN ({', '.join('?' * len(ids)) or 'NULL'})"
+            params.extend(ids)
+    if salary_currency:
+        query += " AND jp.salary_currency = ?"
+        params.append(salary_currency)
+        if salary_min is not None:
+            query += " AND jp.salary_max >= ?"
+            params.append(salary_min)
+        if salary_max is not None:
+            query += " AND jp.salary_min <= ?"
+            params.append(salary_max)
+    order_by = SALARY_SORTS[sort]
+    if sort != "newest" and not salary_currency:
+        # Amounts only compare within a currency: group by it and keep unparsed salaries last
+        order_by = f"jp.salary_currency IS NULL, jp.salary_currency, {order_by}"
+    query += f" ORDER BY {order_by}"
+
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(query, params)
+    postings = c.fetchall()
+    conn.close()
+    return postings
+
+def get_salary_currencies():
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""
+        SELECT DISTINCT salary_currency FROM job_postings
+        WHERE status = 'active' AND salary_currency IS NOT NULL
+    """)
+    currencies = [row[0] for row in c.fetchall()]
+    conn.close()
+    return currencies
+
+def get_salary_bounds(salary_currency):
+    """(lowest salary_min, highest salary_max) among active postings in a currency."""
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""
+        SELECT MIN(salary_min), MAX(salary_max) FROM job_postings
+        WHERE status = 'active' AND salary_currency = ?
+    """, (salary_currency,))
+    bounds = c.fetchone()
+    conn.close()
+    return bounds
+
+def backfill_salary_columns(table="job_postings", source_column="salary_range", batch_size=500, force=False):
+    """
+    Parse `source_column` into the salary_* columns of `table` in id-ordered
+    batches. Only rows never parsed are touched unless `force` is set.
+    Returns the number of rows updated.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    last_id = 0
+    updated = 0
+    while True:
+        c.execute(f"""
+            SELECT id, {source_column} FROM {table}
+            WHERE id > ? AND {source_column} IS NOT NULL AND {source_column} != ''
+            {"" if force else "AND salary_period IS NULL"}
+            ORDER BY id LIMIT ?
+        """, (last_id, batch_size))
+        rows = c.fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        batch = []
+        for row_id, salary_text in rows:
+            columns = salary_columns(salary_text)
+            if columns[1] is not None:
+                batch.append(columns + (row_id,))
+        c.executemany(f"""
+            UPDATE {table} SET salary_currency = ?, salary_min = ?, salary_max = ?, salary_period = ?
+            WHERE id = ?
+        """, batch)
+        if batch:
+            bump_data_version(c, table)
+        conn.commit()
+        updated += len(batch)
+    conn.close()
+    return updated
+
+# ------------------ POSTING LIFECYCLE ------------------
+def close_expired_postings(batch_size=500, default_ttl_days=DEFAULT_POSTING_TTL_DAYS):
+    """
+    Close active postings past expires_at, batch_size rows per transaction.
+    Postings created before expiry existed get created_at + default_ttl_days.
+    Returns the number of postings closed.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute("""
+        UPDATE job_postings SET expires_at = datetime(created_at, ?)
+        WHERE status = 'active' AND expires_at IS NULL
+    """, (f"+{int(default_ttl_days)} days",))
+    # expires_at is part of the API's posting payload
+    if c.rowcount > 0:
+        bump_data_version(c, "job_postings")
+    conn.commit()
+
+    closed = 0
+    while True:
+        c.execute("""
+            UPDATE job_postings SET status = 'closed'
+            WHERE id IN (
+                SELECT id FROM job_postings
+                WHERE status = 'active' AND expires_at <= CURRENT_TIMESTAMP
+                LIMIT ?
+            )
+        """, (batch_size,))
+        count = c.rowcount
+        if not count:
+            break
+        bump_data_version(c, "job_postings")
+        conn.commit()
+        closed += count
+    conn.close()
+    return closed
+
+def _move_rows(c, table, archive, where, params):
+    # Copy by the live table's column names so differing column order is harmless
+    columns = ", ".join(row[1] for row in c.execute(f"PRAGMA table_info({table})"))
+    c.execute(f"""
+        INSERT INTO {archive} ({columns}, archived_at)
+        SELECT {columns}, CURRENT_TIMESTAMP FROM {table} WHERE {where}
+    """, params)
+    c.execute(f"DELETE FROM {table} WHERE {where}", params)
+
+def archive_closed_postings(batch_size=500):
+    """
+    Move closed postings and their applications to the archive tables,
+    batch_size postings per transaction. Returns the number of postings moved.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    archived = 0
+    while True:
+        c.execute("SELECT id FROM job_postings WHERE status = 'closed' LIMIT ?", (batch_size,))
+        ids = [row[0] for row in c.fetchall()]
+        if not ids:
+            break
+        placeholders = ", ".join("?" * len(ids))
+        _move_rows(c, "job_applications", "job_applications_archive", f"job_posting_id IN ({placeholders})", ids)
+        _move_rows(c, "job_postings", "job_postings_archive", f"id IN ({placeholders})", ids)
+        bump_data_version(c, "job_postings")
+        bump_data_version(c, "job_applications")
+        conn.commit()
+        archived += len(ids)
+    conn.close()
+    return archived
+
+# ------------------ ANALYTICS ROLLUPS ------------------
+def rollup_events(batch_size=10000):
+    """
+    Fold events past the stored watermark into posting_daily_stats.
+    Each batch updates the counters and the watermark in one transaction,
+    so every event is counted exactly once. Returns the number of events read.
+    """
+    conn = get_connection()
+    c = conn.cursor()
+    processed = 0
+    while True:
+        row = c.execute("SELECT last_event_id FROM rollup_state WHERE name = 'posting_daily_stats'").fetchone()
+        last_id = row[0] if row else 0
+        c.execute("""
+            SELECT COUNT(*), MAX(id) FROM (
+                SELECT id FROM events WHERE id > ? ORDER BY id LIMIT ?
+            )
+        """, (last_id, batch_size))
+        count, upto_id = c.fetchone()
+        if not count:
+            break
+        c.execute("""
+            INSERT INTO posting_daily_stats (job_posting_id, day, views, applies)
+            SELECT job_posting_id, date(created_at),
+                   SUM(event_type = 'view'), SUM(event_type = 'apply')
+            FROM events
+            WHERE id > ? AND id <= ? AND job_posting_id IS NOT NULL
+            GROUP BY job_posting_id, date(created_at)
+            ON CONFLICT (job_posting_id, day) DO UPDATE SET
+                views = views + excluded.views,
+                applies = applies + excluded.applies
+        """, (last_id, upto_id))
+        c.execute("""
+            INSERT INTO rollup_state (name, last_event_id) VALUES ('posting_daily_stats', ?)
+            ON CONFLICT (name) DO UPDATE SET last_event_id = excluded.last_event_id
+        """, (upto_id,))
+        conn.commit()
+        processed += count
+    conn.close()
+    return processed
+
+def get_posting_funnels(posting_ids):
+    """{posting_id: (views, applies)} summed over all rolled-up days."""
+    if not posting_ids:
+        return {}
+    conn = get_connection()
+    c = conn.cursor()
+    c.execute(f"""
+        SELECT job_posting_id, SUM(views), SUM(applies) FROM posting_daily_stats
+        WHERE job_posting_id IN ({", ".join("?" * len(posting_ids))})
+        GROUP BY job_posting_id
+    """, list(posting_ids))
+    funnels = {posting_id: (views, applies) for posting_id, views, applies in c.fetchall()}
+    conn.close()
+    return funnels
+
+# ------------------ KEYSET PAGINATION ------------------
+# `after` is the (sort_value, id) of the last row of the previous page.
+# Rows come back as sqlite3.Row so callers can read them by column name.
+def _fetch_page(query, params, sort_column, id_column, after, limit):
+    conn = get_connection()
+    conn.row_factory = sqlite3.Row
+    c = conn.cursor()
+    if after:
+        query += f" AND ({sort_column}, {id_column}) < (?, ?)"
+        params = params + tuple(after)
+    query += f" ORDER BY {sort_column} DESC, {id_column} DESC LIMIT ?"
+    c.execute(query, params + (limit,))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+def get_active_job_postings_page(after=None, limit=50):
+    return _fetch_page("""
+        SELECT jp.*, c.company_name, c.location as company_location FROM job_postings jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.status = 'active'
+    """, (), "jp.created_at", "jp.id", after, limit)
+
+def get_job_postings_by_company_page(company_id, after=None, limit=50):
+    return _fetch_page("""
+        SELECT jp.*, c.company_name FROM job_postings jp
+        JOIN companies c ON jp.company_id = c.id
+        WHERE jp.company_id = ?
+    """, (company_id,), "jp.created_at", "jp.id", after, limit)
+
+def get_user_applications_page(user_id, after=None, limit=50):
+    # Same rows as get_user_applications(), so the API keeps archived history too
+    conn = get_connection()
+    union = _user_applications_query(conn.cursor())
+    conn.close()
+    return _fetch_page(f"""
+        SELECT * FROM ({union}) AS applications
+        WHERE 1 = 1
+    """, (user_id, user_id), "applied_date", "id", after, limit)
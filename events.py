@@ -0,0 +1,71 @@
+import atexit
+import json
+import threading
+import time
+
+from database import get_connection
+
+EVENT_TYPES = ("view", "apply", "search")
+
+class EventBuffer:
+    """
+    In-process buffer for analytics events.
+
+    record() only appends to a list. The buffer is written to the
+    append-only `events` table in one transaction once it holds
+    `max_events` events or `max_age` seconds have passed since the last
+    flush, whichever comes first. A daemon thread covers the time trigger
+    when no new events arrive, and the buffer is flushed again at exit.
+    If a write fails the batch is kept for the next flush, up to
+    `max_pending` events.
+    """
+
+    def __init__(self, max_events=200, max_age=5.0, max_pending=10000):
+        self.max_events = max_events
+        self.max_age = max_age
+        self.max_pending = max_pending
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.monotonic()
+        threading.Thread(target=self._flush_periodically, daemon=True).start()
+        atexit.register(self.flush)
+
+    def record(self, event_type, job_posting_id=None, user_id=None, **data):
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        event = (event_type, job_posting_id, user_id, json.dumps(data) if data else None,
+                 time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
+        with self.lock:
+            self.pending.append(event)
+            due = len(self.pending) >= self.max_events
+        if due:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            batch, self.pending = self.pending, []
+            self.last_flush = time.monotonic()
+        if not batch:
+            return 0
+        conn = get_connection()
+        try:
+            conn.executemany("""
+                INSERT INTO events (event_type, job_posting_id, user_id, data, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, batch)
+            conn.commit()
+        except Exception as e:
+            print(f"Error flushing {len(batch)} events: {e}")
+            with self.lock:
+                self.pending[:0] = batch
+                del self.pending[:-self.max_pending]
+            return 0
+        finally:
+            conn.close()
+        return len(batch)
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.max_age / 2)
+            if time.monotonic() - self.last_flush >= self.max_age:
+                self.flush()
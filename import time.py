@@ -7,6 +7,7 @@ import smtplib
 import logging
 import json
 import requests
+from urllib.parse import urlparse
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
@@ -19,6 +20,7 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 
@@ -41,37 +43,155 @@ class Config:
     KEYWORDS = ["Freshers", "Data Analyst"]
     OUTPUT_FILE = "job_application_report.csv"
 
+    # Warm browser settings
+    DRIVER_POOL_SIZE = 1
+    DRIVER_PATH_CACHE = "chromedriver_path.json"  # resolved driver binary, reused offline
+    PROFILE_DIR = "browser_profiles"              # one Chrome profile per pool slot
+    SESSION_DIR = "browser_sessions"              # saved login cookies per domain
+    LOGIN_TIMEOUT = 10
+
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
-class JobAutomationAgent:
-    def __init__(self):
-        self.driver = self._setup_driver()
-        self.results = []
-        self.captcha_blocked_jobs = [] # List to store CAPTCHA failures
+# --- DRIVER BINARY CACHE ---
+def resolve_driver_path(refresh=False):
+    """
+    ChromeDriver path, resolved over the network only once.
+    Baad ke runs cached path use karte hain, koi network call nahi.
+    """
+    if not refresh and os.path.exists(Config.DRIVER_PATH_CACHE):
+        with open(Config.DRIVER_PATH_CACHE) as f:
+            path = json.load(f).get("path")
+        if path and os.path.exists(path):
+            return path
+    path = ChromeDriverManager().install()
+    with open(Config.DRIVER_PATH_CACHE, "w") as f:
+        json.dump({"path": path}, f)
+    return path
+
+# --- WARM DRIVER POOL ---
+class DriverPool:
+    """Pre-started Chrome instances, reused across jobs instead of launched per run."""
 
-    def _setup_driver(self):
+    def __init__(self, size=Config.DRIVER_POOL_SIZE):
+        self.idle = []
+        self.busy = set()
+        self.size = size
+        try:
+            for slot in range(size):
+                self.idle.append(self._start_driver(slot))
+        except Exception:
+            self.close()
+            raise
+
+    def _start_driver(self, slot):
         chrome_options = Options()
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=chrome_options)
+        # Persistent profile: cookies survive between runs
+        profile = os.path.abspath(os.path.join(Config.PROFILE_DIR, f"slot-{slot}"))
+        chrome_options.add_argument(f"--user-data-dir={profile}")
+        try:
+            return webdriver.Chrome(service=Service(resolve_driver_path()), options=chrome_options)
+        except SessionNotCreatedException as e:
+            # Other causes (e.g. a locked profile) would not be fixed by a new driver
+            if "only supports chrome version" not in str(e).lower():
+                raise
+            # Chrome updated since the driver was cached - resolve a matching one
+            logging.info("Cached ChromeDriver rejected, refreshing...")
+            return webdriver.Chrome(service=Service(resolve_driver_path(refresh=True)), options=chrome_options)
+
+    def acquire(self):
+        if self.idle:
+            driver = self.idle.pop()
+        else:
+            self.size += 1
+            driver = self._start_driver(self.size - 1)
+        self.busy.add(driver)
+        return driver
+
+    def release(self, driver):
+        self.busy.discard(driver)
+        self.idle.append(driver)
+
+    def close(self):
+        """Quit every driver, including ones still checked out, so profiles are unlocked."""
+        for driver in self.idle + list(self.busy):
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logging.warning(f"Could not quit driver: {e}")
+        self.idle = []
+        self.busy = set()
+
+# --- PER-DOMAIN LOGIN SESSIONS ---
+class SessionStore:
+    """Login cookies per credential domain, saved after the first successful login."""
+
+    def __init__(self, directory=Config.SESSION_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, domain):
+        return os.path.join(self.directory, f"{domain}.json")
+
+    def load(self, domain):
+        try:
+            with open(self._path(domain)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def save(self, domain, cookies):
+        with open(self._path(domain), "w") as f:
+            json.dump(cookies, f)
+
+class JobAutomationAgent:
+    def __init__(self, pool=None):
+        self.pool = pool or DriverPool()
+        self.driver = self.pool.acquire()
+        self.sessions = SessionStore()
+        self.restored_domains = set()  # domains whose cookies are loaded in this driver
+        self.results = []
+        self.captcha_blocked_jobs = [] # List to store CAPTCHA failures
+
+    # --- HELPER: DOMAIN + SESSION RESTORE ---
+    def _credential_domain(self, job_url):
+        """CREDENTIALS_DB key matching this URL, or None."""
+        for key in Config.CREDENTIALS_DB.keys():
+            if key in job_url.lower():
+                return key
+        return None
+
+    def restore_session(self, domain, job_url):
+        """Saved cookies browser me daalo taaki login dobara na karna pade."""
+        self.restored_domains.add(domain)
+        cookies = self.sessions.load(domain)
+        if not cookies:
+            return
+        parsed = urlparse(job_url)
+        # Cookies can only be set while on the cookie's site
+        self.driver.get(f"{parsed.scheme}://{parsed.netloc}")
+        for cookie in cookies:
+            cookie.pop("sameSite", None)
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                self.driver.add_cookie(cookie)
+            except WebDriverException:
+                pass
+        logging.info(f"Restored {len(cookies)} saved cookies for {domain}")
 
     # --- HELPER: LOGIN HANDLER ---
     def handle_login(self, job_url):
         """
         Agar login page detect hota hai to credentials check karke login karega.
+        Successful login ke cookies save hote hain, agle jobs/runs me reuse.
         """
         logging.info("Login page detected. Checking credentials...")
         
-        # Determine which site it is (generic check)
-        domain = "unknown"
-        for key in Config.CREDENTIALS_DB.keys():
-            if key in job_url.lower():
-                domain = key
-                break
-        
-        if domain == "unknown":
+        domain = self._credential_domain(job_url)
+        if domain is None:
             logging.warning("No credentials found for this site.")
             return False
 
@@ -92,14 +212,25 @@ class JobAutomationAgent:
             login_btn = self.driver.find_element(By.XPATH, "//button[@type='submit' or contains(text(), 'Sign in') or contains(text(), 'Login')]")
             login_btn.click()
             
-            time.sleep(5) # Wait for login to complete
+            # Login complete jab password field gayab ho jaye (fixed sleep ki jagah)
+            WebDriverWait(self.driver, Config.LOGIN_TIMEOUT).until(
+                lambda d: not d.find_elements(By.XPATH, "//input[@type='password']")
+            )
+            self.sessions.save(domain, self.driver.get_cookies())
             return True
+        except TimeoutException:
+            logging.error("Login did not complete in time.")
+            return False
         except Exception as e:
             logging.error(f"Login failed: {e}")
             return False
 
     # --- MODIFIED AUTO APPLY MODULE ---
     def auto_apply(self, job_url, company_name):
+        domain = self._credential_domain(job_url)
+        if domain and domain not in self.restored_domains:
+            self.restore_session(domain, job_url)
+
         logging.info(f"Opening Job URL: {job_url}")
         self.driver.get(job_url)
         time.sleep(3)
@@ -120,8 +251,6 @@ class JobAutomationAgent:
                 success = self.handle_login(job_url)
                 if not success:
                     return "Manual Apply Required (Login Failed)"
-                # Login ke baad page refresh ho sakta hai, dobara check karein
-                time.sleep(3)
         except:
             pass
 
@@ -195,14 +324,20 @@ class JobAutomationAgent:
 
         print("Starting Job Automation...\n")
         
-        for job in dummy_jobs:
-            status = self.auto_apply(job['url'], job['company'])
-            print(f"Result for {job['company']}: {status}")
-            
-        # Last step: Show Notification
-        self.notify_captcha_failures()
-        self.driver.quit()
+        try:
+            for job in dummy_jobs:
+                status = self.auto_apply(job['url'], job['company'])
+                print(f"Result for {job['company']}: {status}")
+                
+            # Last step: Show Notification
+            self.notify_captcha_failures()
+        finally:
+            self.pool.release(self.driver)
 
 if __name__ == "__main__":
-    bot = JobAutomationAgent()
-    bot.run()
\ No newline at end of file
+    pool = DriverPool()
+    try:
+        bot = JobAutomationAgent(pool)
+        bot.run()
+    finally:
+        pool.close()
\ No newline at end of file
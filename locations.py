@@ -0,0 +1,119 @@
+import re
+from collections import namedtuple
+
+NormalisedLocation = namedtuple("NormalisedLocation", ["city", "state", "country", "is_remote"])
+
+REMOTE_MARKERS = ("remote", "work from home", "wfh", "anywhere")
+
+CITY_ALIASES = {
+    "bangalore": "bengaluru",
+    "bombay": "mumbai",
+    "gurgaon": "gurugram",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "poona": "pune",
+    "new delhi": "delhi",
+    "nyc": "new york",
+    "sf": "san francisco",
+}
+
+# City -> (state, country) so "Pune" and "Pune, Maharashtra" land on the same row
+KNOWN_CITIES = {
+    "pune": ("Maharashtra", "India"),
+    "mumbai": ("Maharashtra", "India"),
+    "nagpur": ("Maharashtra", "India"),
+    "nashik": ("Maharashtra", "India"),
+    "thane": ("Maharashtra", "India"),
+    "bengaluru": ("Karnataka", "India"),
+    "mysuru": ("Karnataka", "India"),
+    "hyderabad": ("Telangana", "India"),
+    "chennai": ("Tamil Nadu", "India"),
+    "coimbatore": ("Tamil Nadu", "India"),
+    "delhi": ("Delhi", "India"),
+    "noida": ("Uttar Pradesh", "India"),
+    "lucknow": ("Uttar Pradesh", "India"),
+    "gurugram": ("Haryana", "India"),
+    "kolkata": ("West Bengal", "India"),
+    "ahmedabad": ("Gujarat", "India"),
+    "vadodara": ("Gujarat", "India"),
+    "jaipur": ("Rajasthan", "India"),
+    "indore": ("Madhya Pradesh", "India"),
+    "bhopal": ("Madhya Pradesh", "India"),
+    "kochi": ("Kerala", "India"),
+    "thiruvananthapuram": ("Kerala", "India"),
+    "chandigarh": ("Chandigarh", "India"),
+    "new york": ("New York", "United States"),
+    "san francisco": ("California", "United States"),
+    "seattle": ("Washington", "United States"),
+    "austin": ("Texas", "United States"),
+    "london": (None, "United Kingdom"),
+    "singapore": (None, "Singapore"),
+}
+
+INDIAN_STATES = {
+    "andhra pradesh", "assam", "bihar", "chhattisgarh", "goa", "gujarat", "haryana",
+    "himachal pradesh", "jharkhand", "karnataka", "kerala", "madhya pradesh", "maharashtra",
+    "odisha", "punjab", "rajasthan", "tamil nadu", "telangana", "uttar pradesh",
+    "uttarakhand", "west bengal", "delhi", "chandigarh",
+}
+
+US_STATES = {
+    "al": "Alabama", "az": "Arizona", "ca": "California", "co": "Colorado", "fl": "Florida",
+    "ga": "Georgia", "il": "Illinois", "ma": "Massachusetts", "mi": "Michigan", "nc": "North Carolina",
+    "nj": "New Jersey", "ny": "New York", "oh": "Ohio", "or": "Oregon", "pa": "Pennsylvania",
+    "tx": "Texas", "va": "Virginia", "wa": "Washington",
+}
+
+COUNTRIES = {
+    "india": "India", "in": "India",
+    "usa": "United States", "us": "United States", "united states": "United States",
+    "uk": "United Kingdom", "united kingdom": "United Kingdom",
+    "canada": "Canada", "germany": "Germany", "singapore": "Singapore", "uae": "United Arab Emirates",
+}
+
+def _title(value):
+    return " ".join(word.capitalize() for word in value.split())
+
+def normalise_location(text):
+    """
+    Map free-text like "Pune", "pune, MH" or "Remote - India" to a
+    NormalisedLocation, or None for blank input.
+    """
+    if not text or not text.strip():
+        return None
+    lowered = text.lower()
+    is_remote = any(marker in lowered for marker in REMOTE_MARKERS)
+    for marker in REMOTE_MARKERS + ("hybrid", "onsite", "on-site"):
+        lowered = lowered.replace(marker, " ")
+
+    parts = [part.strip(" .") for part in re.split(r"[,/|;()]|\s-\s", lowered)]
+    parts = [re.sub(r"\s+", " ", part) for part in parts if part]
+
+    city = state = country = None
+    for part in parts:
+        if part in COUNTRIES:
+            country = COUNTRIES[part]
+        elif part in INDIAN_STATES:
+            state, country = _title(part), country or "India"
+        elif part in US_STATES and city:
+            state, country = US_STATES[part], country or "United States"
+        elif city is None:
+            city = CITY_ALIASES.get(part, part)
+
+    if city in KNOWN_CITIES:
+        known_state, known_country = KNOWN_CITIES[city]
+        state = state or known_state
+        country = country or known_country
+    if city:
+        city = _title(city)
+
+    if not (city or state or country or is_remote):
+        return None
+    return NormalisedLocation(city, state, country, bool(is_remote))
+
+def display_name(location):
+    """Stable label used as the unique key of the locations table."""
+    place = ", ".join(part for part in (location.city, location.state, location.country) if part)
+    if location.is_remote:
+        return f"Remote ({place})" if place else "Remote"
+    return place
@@ -0,0 +1,71 @@
+"""
+Batch jobs for the Job AI Portal database.
+
+Run from cron or a worker process, e.g.:
+    python maintenance.py backfill-salary
+    python maintenance.py backfill-locations
+    python maintenance.py sweep-postings --every 3600
+    python maintenance.py rollup-events --every 300
+"""
+import argparse
+import time
+
+from database import (
+    init_db,
+    get_connection,
+    backfill_salary_columns,
+    backfill_location_ids,
+    close_expired_postings,
+    archive_closed_postings,
+    rollup_events,
+)
+
+def has_column(table, column):
+    conn = get_connection()
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    conn.close()
+    return column in columns
+
+def run_backfill_salary(args):
+    updated = backfill_salary_columns(batch_size=args.batch_size, force=args.force)
+    print(f"job_postings: parsed salary for {updated} row(s)")
+    # py_app keeps its own jobs table in the same database
+    if has_column("jobs", "salary_period"):
+        updated = backfill_salary_columns("jobs", "salary", batch_size=args.batch_size, force=args.force)
+        print(f"jobs: parsed salary for {updated} row(s)")
+
+def run_backfill_locations(args):
+    updated = backfill_location_ids(batch_size=args.batch_size, force=args.force)
+    print(f"job_postings: mapped {updated} row(s) to locations")
+
+def run_sweep_postings(args):
+    closed = close_expired_postings(batch_size=args.batch_size)
+    archived = archive_closed_postings(batch_size=args.batch_size)
+    print(f"job_postings: closed {closed} expired, archived {archived} closed posting(s)")
+
+def run_rollup_events(args):
+    processed = rollup_events(batch_size=args.batch_size)
+    print(f"events: rolled up {processed} event(s) into posting_daily_stats")
+
+COMMANDS = {
+    "backfill-salary": run_backfill_salary,
+    "backfill-locations": run_backfill_locations,
+    "sweep-postings": run_sweep_postings,
+    "rollup-events": run_rollup_events,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Job AI Portal maintenance jobs")
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--force", action="store_true", help="Reprocess rows that were already handled")
+    parser.add_argument("--every", type=int, metavar="SECONDS",
+                        help="Keep running, repeating the command at this interval")
+    args = parser.parse_args()
+
+    init_db()
+    while True:
+        COMMANDS[args.command](args)
+        if not args.every:
+            break
+        time.sleep(args.every)
@@ -0,0 +1,117 @@
+import re
+from collections import namedtuple
+
+# min/max are annualised so postings with different pay periods sort together
+ParsedSalary = namedtuple("ParsedSalary", ["currency", "min", "max", "period"])
+
+CURRENCY_MARKERS = [
+    ("INR", ("₹", "inr", "rs", "rupee", "rupees", "lpa", "lakh", "lakhs", "lac", "lacs", "cr", "crore", "crores")),
+    ("USD", ("$", "usd")),
+    ("EUR", ("€", "eur")),
+    ("GBP", ("£", "gbp")),
+]
+
+PERIOD_MARKERS = [
+    ("hourly", ("/hr", "/hour", "per hour", "an hour", "hourly", "ph")),
+    ("daily", ("/day", "per day", "a day", "daily")),
+    ("weekly", ("/wk", "/week", "per week", "a week", "weekly")),
+    ("monthly", ("/mo", "/month", "per month", "a month", "monthly", "pm")),
+    ("annual", ("lpa", "/yr", "/year", "per year", "a year", "per annum", "p.a", "annual", "annually", "yearly")),
+]
+
+PERIODS_PER_YEAR = {"hourly": 2080, "daily": 260, "weekly": 52, "monthly": 12, "annual": 1}
+
+UNIT_MULTIPLIERS = {
+    "k": 1_000,
+    "m": 1_000_000, "mn": 1_000_000, "million": 1_000_000,
+    "l": 100_000, "lpa": 100_000, "lakh": 100_000, "lakhs": 100_000, "lac": 100_000, "lacs": 100_000,
+    "cr": 10_000_000, "crore": 10_000_000, "crores": 10_000_000,
+}
+
+def _marker_re(needles):
+    # Words only match whole: "rs" is not inside "years", "ph" is not "PhD" or "Ph.D"
+    parts = []
+    for needle in needles:
+        pattern = re.escape(needle)
+        if needle[0].isalpha():
+            pattern = r"(?<![a-z])" + pattern
+        if needle[-1].isalpha():
+            pattern += r"(?![a-z]|\.[a-z])"
+        parts.append(pattern)
+    return re.compile("|".join(parts))
+
+CURRENCY_RES = [(name, _marker_re(needles)) for name, needles in CURRENCY_MARKERS]
+PERIOD_RES = [(name, _marker_re(needles)) for name, needles in PERIOD_MARKERS]
+
+AMOUNT_RE = re.compile(
+    r"(?P<currency>[₹$€£]|(?<![a-z])(?:inr|usd|eur|gbp|rs)(?![a-z])\.?)?\s*"
+    r"(?P<number>\d[\d,]*(?:\.\d+)?)\s*"
+    r"(?P<unit>crores?|cr|lakhs?|lacs?|lpa|l|million|mn|m|k)?(?![a-z])"
+)
+# A bare number still counts as pay when a currency or pay period follows it: "40000 INR", "25/hr"
+AMOUNT_SUFFIX_RE = re.compile(
+    r"\s*(?:[₹$€£]|(?:inr|usd|eur|gbp|rupees?)(?![a-z])|/|per(?![a-z])|p\.a(?![a-z])"
+    r"|an?\s+(?:hour|day|week|month|year)(?![a-z]))"
+)
+RANGE_SEPARATOR_RE = re.compile(r"\s*(?:-|–|—|to)\s*")
+
+# Lakh and crore amounts are rupees even without a currency marker: "3.5L - 5L"
+INR_UNITS = {"l", "lakh", "lakhs", "lac", "lacs", "cr", "crore", "crores"}
+
+def _detect(text, markers, default=None):
+    for name, pattern in markers:
+        if pattern.search(text):
+            return name
+    return default
+
+def _value(match, unit=None):
+    unit = match["unit"] or unit
+    value = float(match["number"].rstrip(",").replace(",", ""))
+    return value * UNIT_MULTIPLIERS[unit] if unit else value
+
+def _is_pay(text, *matches):
+    # A currency or unit on any side, or a currency/period right after the last amount
+    return (any(match["currency"] or match["unit"] for match in matches)
+            or AMOUNT_SUFFIX_RE.match(text, matches[-1].end()) is not None)
+
+def _first_amount(text):
+    """
+    (low, high, currency text, units) for the first amount or range that
+    is clearly pay. Other numbers ("3+ years", "5-7 years") are skipped.
+    """
+    matches = list(AMOUNT_RE.finditer(text))
+    for index, match in enumerate(matches):
+        following = matches[index + 1] if index + 1 < len(matches) else None
+        # "10-15 LPA", "$50k to $70k": the second amount's unit carries over to the first
+        if following and RANGE_SEPARATOR_RE.fullmatch(text, match.end(), following.start()):
+            if _is_pay(text, match, following):
+                low = _value(match, following["unit"])
+                return (low, _value(following), match["currency"] or following["currency"],
+                        {match["unit"], following["unit"]})
+        elif _is_pay(text, match):
+            value = _value(match)
+            return value, value, match["currency"], {match["unit"]}
+    return None
+
+def parse_salary(text):
+    """
+    Parse free-text pay like "$80,000 - $120,000", "10-15 LPA" or
+    "Rs. 40,000 per month" into a ParsedSalary, or None if no amount is found.
+    """
+    if not text:
+        return None
+    lowered = f" {text.lower()} "
+    amount = _first_amount(lowered)
+    if not amount:
+        return None
+    low, high, currency, units = amount
+
+    period = _detect(lowered, PERIOD_RES, default="annual")
+    scale = PERIODS_PER_YEAR[period]
+    low, high = min(low, high), max(low, high)
+    return ParsedSalary(
+        currency=_detect(currency or lowered, CURRENCY_RES) or ("INR" if units & INR_UNITS else None),
+        min=int(round(low * scale)),
+        max=int(round(high * scale)),
+        period=period,
+    )
@@ -12,7 +12,9 @@ setup(
         "requests>=2.31.0",
         "selenium>=4.15.0",
         "webdriver-manager>=4.0.0",
-        "beautifulsoup4>=4.12.0"
+        "beautifulsoup4>=4.12.0",
+        "aiohttp>=3.9.0",
+        "pyarrow>=14.0.0"
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.9",
 )
\ No newline at end of file
@@ -0,0 +1,28 @@
+import pytest
+
+import analytics
+
+@pytest.fixture(autouse=True)
+def secret(monkeypatch):
+    monkeypatch.setattr(analytics, "EXPORT_SECRET", "test-secret")
+
+def test_signed_link_verifies():
+    params = analytics.sign_export(1, "applicants", "csv")
+    assert analytics.verify_export(1, "applicants", "csv", str(params["expires"]), params["signature"])
+
+def test_link_is_bound_to_company_kind_and_format():
+    params = analytics.sign_export(1, "applicants", "csv")
+    expires, signature = str(params["expires"]), params["signature"]
+    assert not analytics.verify_export(2, "applicants", "csv", expires, signature)
+    assert not analytics.verify_export(1, "postings", "csv", expires, signature)
+    assert not analytics.verify_export(1, "applicants", "parquet", expires, signature)
+
+@pytest.mark.parametrize("expires, signature", [
+    ("9999999999", "é"),
+    ("9999999999", ""),
+    ("soon", "abc"),
+    ("1", "abc"),
+    (None, None),
+])
+def test_bad_links_are_rejected(expires, signature):
+    assert not analytics.verify_export(1, "applicants", "csv", expires, signature)
@@ -0,0 +1,55 @@
+import pytest
+
+from autocomplete import AutocompleteIndex, PrefixTrie
+
+@pytest.fixture
+def trie():
+    trie = PrefixTrie()
+    for value, label in enumerate([
+        "Pune, Maharashtra, India",
+        "Remote (Pune, Maharashtra, India)",
+        "Remote (India)",
+        "Mumbai, Maharashtra, India",
+        "Tata Consultancy",
+    ]):
+        trie.insert(label, value)
+    return trie
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("pune", {0, 1}),
+    ("Pune", {0, 1}),
+    ("india", {0, 1, 2, 3}),
+    ("maha", {0, 1, 3}),
+    ("remote (pune", {1}),
+    ("pune, maha", {0, 1}),
+    ("cons", {4}),
+    ("tata cons", {4}),
+    ("une", set()),
+    ("", set()),
+    ("(", set()),
+])
+def test_search_matches_word_starts(trie, prefix, expected):
+    assert set(trie.search(prefix)) == expected
+
+def test_search_limit(trie):
+    assert len(trie.search("india", limit=2)) == 2
+
+def test_index_only_rebuilds_when_version_changes():
+    rows = [(1, "Acme"), (2, "Globex")]
+    version = [0]
+    loads = []
+
+    def load_since(last_id):
+        loads.append(last_id)
+        return [row for row in rows if row[0] > last_id]
+
+    index = AutocompleteIndex(load_since, lambda: version[0])
+    assert index.suggest("acme") == [(1, "Acme")]
+    rows.append((3, "Acme Labs"))
+    assert index.suggest("acme") == [(1, "Acme"), (3, "Acme Labs")]
+    assert loads == [0, 2]
+
+    rows[0] = (1, "Initech")
+    version[0] += 1
+    assert index.suggest("acme") == [(3, "Acme Labs")]
+    assert loads[-1] == 0
@@ -0,0 +1,33 @@
+import pytest
+
+from locations import NormalisedLocation, display_name, normalise_location
+
+@pytest.mark.parametrize("text, expected", [
+    ("Pune", NormalisedLocation("Pune", "Maharashtra", "India", False)),
+    ("pune, Maharashtra", NormalisedLocation("Pune", "Maharashtra", "India", False)),
+    ("Bangalore", NormalisedLocation("Bengaluru", "Karnataka", "India", False)),
+    ("Gurgaon (Haryana)", NormalisedLocation("Gurugram", "Haryana", "India", False)),
+    ("Austin, TX", NormalisedLocation("Austin", "Texas", "United States", False)),
+    ("London, UK", NormalisedLocation("London", None, "United Kingdom", False)),
+    ("Remote - India", NormalisedLocation(None, None, "India", True)),
+    ("Pune / Remote", NormalisedLocation("Pune", "Maharashtra", "India", True)),
+    ("Work from home", NormalisedLocation(None, None, None, True)),
+])
+def test_normalise_location(text, expected):
+    assert normalise_location(text) == expected
+
+@pytest.mark.parametrize("text", [None, "", "   ", "Hybrid"])
+def test_blank_location(text):
+    assert normalise_location(text) is None
+
+def test_spellings_share_a_display_name():
+    names = {display_name(normalise_location(text)) for text in ("Pune", "pune, MH", "Poona, Maharashtra, India")}
+    assert names == {"Pune, Maharashtra, India"}
+
+@pytest.mark.parametrize("text, expected", [
+    ("Pune / Remote", "Remote (Pune, Maharashtra, India)"),
+    ("Remote - India", "Remote (India)"),
+    ("Remote", "Remote"),
+])
+def test_remote_display_name(text, expected):
+    assert display_name(normalise_location(text)) == expected
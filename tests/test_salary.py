@@ -0,0 +1,49 @@
+import pytest
+
+from salary import ParsedSalary, parse_salary
+
+@pytest.mark.parametrize("text, expected", [
+    ("$80,000 - $120,000", ParsedSalary("USD", 80_000, 120_000, "annual")),
+    ("$50k to $70k", ParsedSalary("USD", 50_000, 70_000, "annual")),
+    ("Up to $150k", ParsedSalary("USD", 150_000, 150_000, "annual")),
+    ("10-15 LPA", ParsedSalary("INR", 1_000_000, 1_500_000, "annual")),
+    ("₹8,00,000 - ₹12,00,000", ParsedSalary("INR", 800_000, 1_200_000, "annual")),
+    ("Rs. 40,000 per month", ParsedSalary("INR", 480_000, 480_000, "monthly")),
+    ("Rs 50000 pm", ParsedSalary("INR", 600_000, 600_000, "monthly")),
+    ("1.2 Cr", ParsedSalary("INR", 12_000_000, 12_000_000, "annual")),
+    ("£30,000 a year", ParsedSalary("GBP", 30_000, 30_000, "annual")),
+    ("€45k", ParsedSalary("EUR", 45_000, 45_000, "annual")),
+    ("$25/hr", ParsedSalary("USD", 52_000, 52_000, "hourly")),
+    ("40000 INR", ParsedSalary("INR", 40_000, 40_000, "annual")),
+    ("50-70k", ParsedSalary(None, 50_000, 70_000, "annual")),
+])
+def test_parses_common_formats(text, expected):
+    assert parse_salary(text) == expected
+
+def test_rs_inside_a_word_is_not_rupees():
+    assert parse_salary("$60,000 - $80,000 for 3+ years") == ParsedSalary("USD", 60_000, 80_000, "annual")
+
+@pytest.mark.parametrize("text", ["$100k, PhD required", "$100k, Ph.D preferred"])
+def test_phd_is_not_per_hour(text):
+    assert parse_salary(text) == ParsedSalary("USD", 100_000, 100_000, "annual")
+
+def test_unrelated_numbers_are_ignored():
+    assert parse_salary("$120,000 per year, 2 years") == ParsedSalary("USD", 120_000, 120_000, "annual")
+
+@pytest.mark.parametrize("text", ["5-7 years, $90k", "2 - 3 yrs experience, $90,000"])
+def test_experience_range_is_not_pay(text):
+    assert parse_salary(text) == ParsedSalary("USD", 90_000, 90_000, "annual")
+
+@pytest.mark.parametrize("text, expected", [
+    ("3.5L - 5L", ParsedSalary("INR", 350_000, 500_000, "annual")),
+    ("8 lakhs", ParsedSalary("INR", 800_000, 800_000, "annual")),
+])
+def test_lakh_amounts_are_rupees(text, expected):
+    assert parse_salary(text) == expected
+
+def test_bonus_is_not_part_of_the_range():
+    assert parse_salary("20 LPA + 2L bonus") == ParsedSalary("INR", 2_000_000, 2_000_000, "annual")
+
+@pytest.mark.parametrize("text", [None, "", "Competitive", "3+ years experience", "5-7 years experience"])
+def test_no_pay_amount(text):
+    assert parse_salary(text) is None